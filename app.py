@@ -1,19 +1,28 @@
+# Configure logging first, so that it applies to every module logger, including under Gunicorn which imports app:app.server instead of running __main__
+from conf.logging_config import setup_logging
+setup_logging()
+
 # Import packages
 from dash import Dash, html
-import dash_leaflet as dl
 import dash_bootstrap_components as dbc
-import dash_core_components as dcc
-import dash_daq as daq
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+import flask
+import functools
 import sys
 import logging
+from flask_compress import Compress
 
-from .conf.api_key import MAPBOX_DEFAULT_KEY
+from conf.api_key import MAPBOX_DEFAULT_KEY
+from conf.cache_config import cache, get_cache_config
 
 from components import build_dashboard_banner,radius_selection_button, build_street_map_component, show_descriptive_stats, display_tabs
 
+logger = logging.getLogger(__name__)
+
+# Dash serialises layout and callback responses via plotly's JSON encoder, use orjson engine for faster encoding
+pio.json.config.default_engine = "orjson"
+
 # Dash instantiation ---------------------------------------------------------#
 app = Dash(__name__,
            meta_tags=[{
@@ -25,6 +34,14 @@ app = Dash(__name__,
            title="SimpleDashboard Demo"
         )
 
+# Compress layout and callback responses, preferring brotli over gzip
+app.server.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.server.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app.server)
+
+# Cache for upstream API responses shared by all callbacks
+cache.init_app(app.server, config=get_cache_config())
+
 # Dashboard app layout ------------------------------------------------------#
 app.layout = html.Div(
     id="root",
@@ -54,8 +71,14 @@ app.layout = html.Div(
                         show_descriptive_stats(),
                         # Next div showing details in tab format(bus,bicycle,taxi,carpark and nearby available cctv footage)
                         display_tabs(),
-                        #Content of tab
-                        html.Div(id='tab-content')
+                        #Content of tab. Placed below the fold, so browser may skip its layout and paint until scrolled into view
+                        html.Div(
+                            id='tab-content',
+                            style={
+                                "contentVisibility": "auto",
+                                "containIntrinsicSize": "auto 400px",
+                            },
+                        )
                     ],
                     style={
                         "display": "inline-block",
@@ -66,17 +89,34 @@ app.layout = html.Div(
             ],
             className="row",
         ),
+    ],
 )
 
+# Layout is static, so serialise it on first page load and serve the cached JSON instead of re-encoding it every time.
+# It is built from the same value as Dash's serve_layout, so components Dash appends to layout are kept.
+@functools.lru_cache(maxsize=None)
+def get_layout_json() -> str:
+    return to_json_plotly(app._layout_value())
+
+@app.server.before_request
+def serve_cached_layout():
+    # A layout function is evaluated per page load, so it is left to Dash
+    if app._layout_is_function:
+        return None
+    if flask.request.path == f"{app.config.routes_pathname_prefix}_dash-layout":
+        return flask.Response(get_layout_json(),
+                              mimetype="application/json",
+                              headers={"Cache-Control": "public, max-age=60"})
+
 # Callback imports -----------------------------------------------------------
 # Putting callback before app layout results in error.
-from callbacks import map_callback, tabs_callback
+from callbacks import map_callback, tabs_callback, descriptive_stats_callback
 
 """ start the web application
     the host IP 0.0.0.0 is needed for dockerized version of this dash application
 """
 if __name__ == '__main__':
-    logging.info(sys.version)
+    logger.info("Starting dashboard with Python %s", sys.version)
 
     # If running locally in Anaconda env:
     if "conda-forge" in sys.version:
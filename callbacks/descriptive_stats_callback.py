@@ -0,0 +1,54 @@
+from dash import Input, Output, callback, no_update
+import logging
+from typing import Dict, Tuple
+from helpers.process_static_data import CARPARK_RECORDS, CARPARK_COORDS, CARPARK_TREE, query_locations_within_radius
+from query_api import query_all_surrounding_transport_artefacts
+
+logger = logging.getLogger(__name__)
+
+# Radius in KM of each radius selection option
+RADIUS_IN_KM_DICT = {
+    "500m Radius": 0.5,
+    "1Km Radius": 1.0,
+}
+
+# Shown in place of a count when its API query fails, so that it is not mistaken for no nearby artefact
+UNAVAILABLE_COUNT_DISPLAY = "-"
+
+# Callback for showing number of nearby transport artefacts of searched location
+@callback(
+    Output(component_id="nearby-bus-stop-led", component_property="value"),
+    Output(component_id="nearby-taxi-stand-led", component_property="value"),
+    Output(component_id="nearby-bicycle-parking-led", component_property="value"),
+    Output(component_id="nearby-carpark-led", component_property="value"),
+    Input(component_id="selected-location-store", component_property="data"),
+    Input(component_id="radius-selection", component_property="value"),
+)
+def update_nearby_artefact_counts(selected_location: Dict, radius_option: str) -> Tuple[str, str, str, str]:
+    """Function which counts bus stops, taxi stands, bicycle parking points and carparks within the selected radius of the searched location.
+
+    Args:
+        selected_location (Dict): Dictionary of lat/lon of searched location.
+        radius_option (str): Selected radius option, which is a key of RADIUS_IN_KM_DICT.
+
+    Returns:
+        Tuple[str, str, str, str]: Number of nearby bus stops, taxi stands, bicycle parking points and carparks. UNAVAILABLE_COUNT_DISPLAY for a failed API query. no_update when no location is searched.
+    """
+    if not selected_location:
+        return no_update, no_update, no_update, no_update
+
+    radius_in_km = RADIUS_IN_KM_DICT.get(radius_option, 0.5)
+    point_of_interest = (selected_location["lat"], selected_location["lon"])
+
+    nearby_artefact_dict = query_all_surrounding_transport_artefacts(point_of_interest, radius_in_km)
+    nearby_carpark_list = query_locations_within_radius(CARPARK_RECORDS,
+                                                        CARPARK_COORDS,
+                                                        CARPARK_TREE,
+                                                        point_of_interest,
+                                                        radius_in_km)
+    logger.debug("Counted nearby artefacts within %skm of %s", radius_in_km, point_of_interest)
+    nearby_artefact_count_list = [
+        UNAVAILABLE_COUNT_DISPLAY if nearby_artefact_dict[api_name] is None else str(len(nearby_artefact_dict[api_name][0]))
+        for api_name in ["BUS_STOPS_API", "TAXI_STANDS_API", "BICYCLE_PARKING_API"]
+    ]
+    return (*nearby_artefact_count_list, str(len(nearby_carpark_list)))
@@ -1,67 +1,103 @@
-from dash import Dash, dcc, html, Input, Output, callback
+from dash import Dash, dcc, html, Input, Output, callback, Patch, no_update
 from dash.dependencies import Input, Output, State
-import plotly.graph_objs as go
+import logging
+import orjson
 import requests
+from typing import Dict, Tuple
+from conf.cache_config import cache
+from query_api import SESSION, REQUEST_TIMEOUT
 
+logger = logging.getLogger(__name__)
 
-def search_location_via_onemap_info(searchVal: str, returnGeom : str ="Y", getAddrDetails: str = "N", onemap_url = "https://www.onemap.gov.sg/api/common/elastic/search?"):
+ONEMAP_SEARCH_URL = "https://www.onemap.gov.sg/api/common/elastic/search"
 
-    searchVal = str(searchVal)
-    # Space replacement for url construct
-    searchVal = searchVal.strip().replace(" ","%20")
+# Search results of an address rarely change. Failed searches raise, so that they are not cached and are retried on next search.
+@cache.memoize(timeout=86400)
+def _query_onemap_search(searchVal: str, returnGeom: str, getAddrDetails: str, onemap_url: str) -> Dict:
 
-    # Construct search url
-    onemap_search_url = onemap_url + f"searchVal={searchVal}&returnGeom={returnGeom}&getAddrDetails={getAddrDetails}"
-    print(onemap_search_url)
+    # Query string is url encoded by requests
+    params_dict = {
+        "searchVal": str(searchVal).strip(),
+        "returnGeom": returnGeom,
+        "getAddrDetails": getAddrDetails,
+    }
+    logger.debug("Searching location via %s with %s", onemap_url, params_dict)
 
     req_headers = {"User-agent": "qzq_test",
                    "Content-Type": "application/json"
                   }
-    res = requests.request("GET", onemap_search_url, headers=req_headers)
-    # Check the status code before extending the number of posts
-    if res.status_code == 200:
-        print(f"Request successful with status code {res.status_code}")
-        the_json = res.json()
-        # Page 1 is the default return
-        nearest_match = the_json["results"][0]
-        
-        return nearest_match
-    else:
-        print(f"Return unsuccessful with status code {res.status_code}")
-        # Raise if HTTPError occured
-        res.raise_for_status()
+    res = SESSION.get(onemap_url, params=params_dict, headers=req_headers, timeout=REQUEST_TIMEOUT)
+    # Raise if HTTPError occured
+    res.raise_for_status()
 
+    logger.debug("Request successful with status code %s", res.status_code)
+    the_json = orjson.loads(res.content)
+    # Page 1 is the default return
+    results = the_json.get("results", [])
+    if not results:
         return {}
+    nearest_match = results[0]
+
+    return nearest_match
+
+def search_location_via_onemap_info(searchVal: str, returnGeom : str ="Y", getAddrDetails: str = "N", onemap_url = ONEMAP_SEARCH_URL) -> Dict:
+    """Function which searches OneMap for a search string and returns its nearest match.
+
+    Args:
+        searchVal (str): Search string of an address, building name or postal code.
+        returnGeom (str, optional): Whether coordinates are returned ("Y" or "N"). Defaults to "Y".
+        getAddrDetails (str, optional): Whether address details are returned ("Y" or "N"). Defaults to "N".
+        onemap_url (str, optional): OneMap search API url. Defaults to ONEMAP_SEARCH_URL.
+
+    Returns:
+        Dict: Nearest match of search string. Empty dictionary when there is no match or search fails.
+    """
+    try:
+        return _query_onemap_search(searchVal, returnGeom, getAddrDetails, onemap_url)
+    except requests.exceptions.RequestException as err:
+        logger.warning(err)
+    except orjson.JSONDecodeError as errj:
+        logger.warning(errj)
+    return {}
 
 # Callback for map update using input search string of address to 
 @callback(
-Output(component_id="onestreetmap", component_property='figure'),
-[Input("input_search", 'clickData')])
-def update_map(n_clicks):
-    map_figure = {
-        'data': [
-            go.Scattermapbox(
-                lat=[32],
-                lon=[-110],
-                mode='markers',
-                marker=dict(
-                    size=4
-                )
-            )
-        ],
-        # Map layout
-        'layout': go.Layout(
-            autosize=True,
-            hovermode='closest',
-            mapbox=dict(
-                accesstoken=OSM_API_TOKEN,
-                center=dict(
-                    lat=40,
-                    lon=-100
-                ),
-                zoom=8
-            )
-        )}
-
-    fig.update_layout(map_figure)
-    return fig
\ No newline at end of file
+    Output(component_id="map", component_property="figure"),
+    Output(component_id="selected-location-store", component_property="data"),
+    Input("input_search", "n_submit"),
+    State("input_search", "value"),
+    State("selected-location-store", "data"),
+    prevent_initial_call=True,
+)
+def update_map(n_submit: int, search_value: str, current_location: Dict) -> Tuple[Patch, Dict]:
+    """Function which recentres the map on the nearest OneMap match of the submitted search string and stores its coordinates.
+
+    Args:
+        n_submit (int): Number of times enter is pressed in search bar.
+        search_value (str): Search string in search bar.
+        current_location (Dict): Dictionary of lat/lon of previously searched location.
+
+    Returns:
+        Tuple[Patch, Dict]: Partial figure update containing only the new map centre and zoom, and dictionary of lat/lon of the match. no_update when there is no match, or for the dictionary when the match is unchanged.
+    """
+    if not search_value:
+        return no_update, no_update
+
+    nearest_match = search_location_via_onemap_info(search_value)
+    if not nearest_match:
+        return no_update, no_update
+
+    # Parsed once here so that other callbacks can read coordinates from store directly
+    selected_location = {
+        "lat": float(nearest_match["LATITUDE"]),
+        "lon": float(nearest_match["LONGITUDE"]),
+    }
+
+    # Only send the changed map centre over the wire instead of the whole figure with its traces
+    patched_figure = Patch()
+    patched_figure["layout"]["mapbox"]["center"] = selected_location
+    patched_figure["layout"]["mapbox"]["zoom"] = 15
+    # Map is still recentred when the same location is resubmitted, but store is left unchanged so that callbacks depending on it are not triggered again
+    if selected_location == current_location:
+        return patched_figure, no_update
+    return patched_figure, selected_location
\ No newline at end of file
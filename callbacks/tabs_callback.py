@@ -1,29 +1,25 @@
-from dash import Dash, dcc, html, Input, Output, callback
+from dash import Output, Input, clientside_callback
+from plotly.io.json import to_json_plotly
 from components.tab_component import build_bus_stop_tab, build_bicycle_parking_stops_tab, build_taxi_stands_tab, build_carpark_tab, build_traffic_cctv_tab, build_default_display
 
-# Define callback when tabs are selected
-@callback(
+# Tab contents are static, so they are serialised once at import and looked up in the browser.
+TAB_CONTENT_DICT = {
+    "bus-stop-tab": build_bus_stop_tab(),
+    "bicycle-tab": build_bicycle_parking_stops_tab(),
+    "taxi-stand-tab": build_taxi_stands_tab(),
+    "carpark-tab": build_carpark_tab(),
+    "traffic-cctv-tab": build_traffic_cctv_tab(),
+    "default": build_default_display(),
+}
+
+# Define clientside callback when tabs are selected, which avoids a server round trip per tab switch
+clientside_callback(
+    f"""
+    function(tab) {{
+        const tabContents = {to_json_plotly(TAB_CONTENT_DICT)};
+        return tabContents[tab] || tabContents["default"];
+    }}
+    """,
     Output('tab-content', 'children'),
     Input('multi-tabs', 'value')
-)
-def render_content(tab: str) -> html.Div:
-    """Function which render content based on tab selection on Dash's tab component assisted by dash callback implementation.
-    
-    Args:
-        tab (str): Tab value based on selection on screen
-
-    Returns:
-        html.Div: HTML Division generated by function call based on tab option selected. 
-    """
-    if tab == 'bus-stop-tab':
-        return build_bus_stop_tab()
-    elif tab == 'bicycle-tab':
-        return build_bicycle_parking_stops_tab()
-    elif tab == 'taxi-stand-tab':
-        return build_taxi_stands_tab()
-    elif tab == 'carpark-tab':
-        return build_carpark_tab()
-    elif tab == "traffic-cctv-tab":
-        return build_traffic_cctv_tab()
-    else:
-        return build_default_display()
\ No newline at end of file
+)
\ No newline at end of file
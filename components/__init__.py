@@ -0,0 +1,3 @@
+from components.banner_component import build_dashboard_banner
+from components.map_component import radius_selection_button, build_street_map_component, show_descriptive_stats
+from components.tab_component import display_tabs
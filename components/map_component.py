@@ -1,16 +1,30 @@
-import dash
+import os
 import dash_core_components as dcc
-import plotly.graph_objects as go
 import plotly.express as px
-import pandas as pd
 import dash_daq as daq
 import dash_html_components as html
+import orjson
+
+# Pre-baked by scripts/bake_static.py from data/traffic_cams_location.csv
+TRAFFIC_CAM_LOCATIONS_FILEPATH = os.path.join("assets", "traffic_cam_locations.json")
+with open(TRAFFIC_CAM_LOCATIONS_FILEPATH, "rb") as f:
+    TRAFFIC_CAM_LOCATIONS = orjson.loads(f.read())
+
+# LED display id and label for each type of nearby transport artefact
+NEARBY_ARTEFACT_DISPLAY_LIST = [
+    ("nearby-bus-stop-led", "Number of nearby bus stops"),
+    ("nearby-taxi-stand-led", "Number of nearby taxi stands"),
+    ("nearby-bicycle-parking-led", "Number of nearby bicycle parking points"),
+    ("nearby-carpark-led", "Number of nearby carparks"),
+]
+# Shared by all LED displays
+LED_DISPLAY_STYLE = {'display': 'flex', 'justify-content': 'center'}
 
 def radius_selection_button():
     return html.Div(
         id="Select-options",
         children=[   
-            dcc.RadioItems(['500m Radius', '1Km Radius'], '500m Radius', inline=True)
+            dcc.RadioItems(['500m Radius', '1Km Radius'], '500m Radius', id="radius-selection", inline=True)
         ],
         style={"textAlign": "right"},
     ),
@@ -18,11 +32,10 @@ def radius_selection_button():
 
 def fig_map(mapbox_default_key: str):
 
-    # Display traffic cam locations based on existing known data
-    traffic_cam_locations_df = pd.read_csv("data/traffic_cam_locations.csv")
+    # Display traffic cam locations based on pre-baked data
     # Set mapbox key for plotly express to facilitate switch to other mapbox style as necessary
     px.set_mapbox_access_token(mapbox_default_key)
-    fig = px.scatter_mapbox(traffic_cam_locations_df,
+    fig = px.scatter_mapbox(TRAFFIC_CAM_LOCATIONS,
                             lat="Lat",
                             lon="Lon",
                             zoom=7,
@@ -32,9 +45,9 @@ def fig_map(mapbox_default_key: str):
                             hover_name="Description of Location" #Appear in tooltip
                             )
 
-    # Limit map bounds
-    fig.update(mapbox_bounds={"west":1.25, "east":1.35, "south":104, "north":103})
-    fig.update(margin={"l":0, "r":0, "b":0, "t":0})
+    # Limit map bounds to Singapore
+    fig.update_layout(mapbox_bounds={"west":103.6, "east":104.1, "south":1.15, "north":1.48})
+    fig.update_layout(margin={"l":0, "r":0, "b":0, "t":0})
     return fig
 
 
@@ -48,7 +61,11 @@ def build_street_map_component(mapbox_default_key: str):
                 id="input_search",
                 type="text",
                 placeholder="input search location",
+                # Only sync value to server on enter or loss of focus instead of every keystroke
+                debounce=True,
             ),
+            # Lat/lon of searched location for use by other callbacks
+            dcc.Store(id="selected-location-store"),
             html.Div(
                 id="osm-map-container",
                 children=[
@@ -88,7 +105,7 @@ def display_artefacts(id: str, label: str, value: str, size: int=50,):
             value=value,
             size=size)
         ],
-    style={'display': 'flex', 'justify-content': 'center'}
+    style=LED_DISPLAY_STYLE
     )
 
 
@@ -96,30 +113,7 @@ def show_descriptive_stats():
     return html.Div(
         id="Descriptive-stats",
         children=[
-            # Bus stop
-            display_artefacts(
-                id="nearby-bus-stop-led",
-                label="Number of nearby bus stops",
-                value="0",
-            ),
-            # Taxi stand
-            display_nearby_artefacts(
-                id="nearby-taxi-stand-led",
-                label="Number of nearby taxi stands",
-                value="0",
-            ),
-
-            # Bicycle Parking area
-            display_nearby_artefacts(
-                id="nearby-bicycle-parking-led",
-                label="Number of nearby bicycle parking points",
-                value="0",
-            ),
-            # Nearby Parking area
-            display_nearby_artefacts(
-                id="nearby-carpark-led",
-                label="Number of nearby carparks",
-                value="0",
-            ),
+            display_artefacts(id=led_id, label=label, value="0")
+            for led_id, label in NEARBY_ARTEFACT_DISPLAY_LIST
         ]
     )
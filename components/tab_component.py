@@ -5,7 +5,7 @@ def display_tabs():
     # To show clickable tabs
     return html.Div(
         id = "tabs",
-        classname="tabs",
+        className="tabs",
         children = dcc.Tabs(
             id="multi-tabs",
             value="tab2",
@@ -35,7 +35,7 @@ def display_tabs():
                 dcc.Tab(
                     id="traffic-cctv-tab",
                     label="Nearest available CCTV footage",
-                    value="cctv-tab",
+                    value="traffic-cctv-tab",
                 ),
             ]
         )
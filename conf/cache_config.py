@@ -0,0 +1,25 @@
+import os
+from typing import Dict
+from flask_caching import Cache
+
+# Shared cache instance, bound to the Dash server in app.py
+cache = Cache()
+
+
+def get_cache_config() -> Dict:
+    """Function which returns Flask-Caching configuration. Redis is used when CACHE_REDIS_URL environment variable is set so that cached responses are shared across workers, otherwise a process-local cache is used.
+
+    Returns:
+        Dict: Flask-Caching configuration.
+    """
+    redis_url = os.getenv("CACHE_REDIS_URL")
+    if redis_url:
+        return {
+            "CACHE_TYPE": "RedisCache",
+            "CACHE_REDIS_URL": redis_url,
+            "CACHE_DEFAULT_TIMEOUT": 300,
+        }
+    return {
+        "CACHE_TYPE": "SimpleCache",
+        "CACHE_DEFAULT_TIMEOUT": 300,
+    }
@@ -1,4 +1,5 @@
 import logging
+import logging.config
 import os
 from datetime import datetime
 import yaml
@@ -7,7 +8,7 @@ import yaml
 def setup_logging() -> None:
     """Function that facilitates logging setup for python program.
     """
-    with open("logging.yml", "r", encoding="utf-8") as f:
+    with open(os.path.join("conf", "logging.yml"), "r", encoding="utf-8") as f:
         config_dict = yaml.load(f, Loader=yaml.FullLoader)
 
      # Based on logger.yml handlers.
@@ -0,0 +1,57 @@
+import numpy as np
+from typing import Union
+
+EARTH_RADIUS_KM = 6371.0088
+# Length of one degree of latitude in km
+KM_PER_DEGREE = 2 * np.pi * EARTH_RADIUS_KM / 360
+
+
+def haversine_distance_km(
+    centre_lat: float,
+    centre_lon: float,
+    lat_array: Union[np.ndarray, float],
+    lon_array: Union[np.ndarray, float],
+) -> np.ndarray:
+    """Function which computes great-circle distances between a centre point and an array of points in a single vectorised pass.
+
+    Args:
+        centre_lat (float): WGS84 latitude of centre point.
+        centre_lon (float): WGS84 longitude of centre point.
+        lat_array (Union[np.ndarray, float]): WGS84 latitudes of points.
+        lon_array (Union[np.ndarray, float]): WGS84 longitudes of points.
+
+    Returns:
+        np.ndarray: Distances in km of each point from centre point.
+    """
+    centre_lat_rad = np.radians(centre_lat)
+    lat_rad = np.radians(lat_array)
+    dlat = lat_rad - centre_lat_rad
+    dlon = np.radians(lon_array) - np.radians(centre_lon)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(centre_lat_rad) * np.cos(lat_rad) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def bounding_box_mask(
+    centre_lat: float,
+    centre_lon: float,
+    lat_array: np.ndarray,
+    lon_array: np.ndarray,
+    radius_in_km: float,
+) -> np.ndarray:
+    """Function which flags points lying inside the lat/lon box enclosing a radius around a centre point. Used as a cheap prefilter before computing exact distances.
+
+    Args:
+        centre_lat (float): WGS84 latitude of centre point.
+        centre_lon (float): WGS84 longitude of centre point.
+        lat_array (np.ndarray): WGS84 latitudes of points.
+        lon_array (np.ndarray): WGS84 longitudes of points.
+        radius_in_km (float): Radius around centre point in km.
+
+    Returns:
+        np.ndarray: Boolean array which is True for points inside the box.
+    """
+    # Slightly widened so that no point within radius is rejected
+    lat_radius_in_deg = radius_in_km / KM_PER_DEGREE * 1.01
+    lon_radius_in_deg = lat_radius_in_deg / np.cos(np.radians(centre_lat))
+    return (np.abs(lat_array - centre_lat) <= lat_radius_in_deg) & (np.abs(lon_array - centre_lon) <= lon_radius_in_deg)
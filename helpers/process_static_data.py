@@ -0,0 +1,125 @@
+import csv
+import os
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Dict, List, Optional, Tuple
+
+from helpers.geo_utils import haversine_distance_km, KM_PER_DEGREE
+
+HDB_CARPARK_FILEPATH = os.path.join("data", "HDBCarparkInformationWGS84.csv")
+# Carpark columns used by dashboard besides coordinates
+HDB_CARPARK_USECOLS = ["car_park_no", "address"]
+
+
+def load_location_records(
+    csv_path: str,
+    latitude_col: str = "Lat",
+    longitude_col: str = "Lon",
+    usecols: Optional[List[str]] = None
+) -> List[Dict]:
+    """Function which reads a static location csv file into a list of records, with latitude and longitude converted to float.
+
+    Args:
+        csv_path (str): Filepath of static location csv.
+        latitude_col (str, optional): Column name representing latitude. Defaults to "Lat".
+        longitude_col (str, optional): Column name representing longitude. Defaults to "Lon".
+        usecols (Optional[List[str]], optional): Columns to be kept in addition to latitude and longitude. Defaults to None, which keeps all columns.
+
+    Returns:
+        List[Dict]: List of location records keyed by csv column names.
+    """
+    with open(csv_path, "r", newline="") as f:
+        location_records = list(csv.DictReader(f))
+
+    # Unused columns are dropped so that records held in memory and returned by queries stay small
+    if usecols is not None:
+        keep_col_list = [*usecols, latitude_col, longitude_col]
+        location_records = [{col: record[col] for col in keep_col_list} for record in location_records]
+    for record in location_records:
+        record[latitude_col] = float(record[latitude_col])
+        record[longitude_col] = float(record[longitude_col])
+    return location_records
+
+
+def build_location_tree(
+    location_records: List[Dict],
+    latitude_col: str = "Lat",
+    longitude_col: str = "Lon"
+) -> Tuple[np.ndarray, cKDTree]:
+    """Function which builds a KD-tree over the lat/lon coordinates of static locations.
+
+    As Singapore lies near the equator, a degree of longitude is almost as long as a degree of latitude, hence euclidean distances in degrees preserve the ordering of nearby locations.
+
+    Args:
+        location_records (List[Dict]): List of static location records.
+        latitude_col (str, optional): Key name representing latitude. Defaults to "Lat".
+        longitude_col (str, optional): Key name representing longitude. Defaults to "Lon".
+
+    Returns:
+        Tuple[np.ndarray, cKDTree]: Contiguous float32 array of (lat, lon) coordinates and KD-tree built over it.
+    """
+    coords = np.array([(record[latitude_col], record[longitude_col]) for record in location_records], dtype=np.float32).reshape(-1, 2)
+    return coords, cKDTree(coords)
+
+
+# Static data are loaded and indexed once at import
+CARPARK_RECORDS = load_location_records(HDB_CARPARK_FILEPATH, usecols=HDB_CARPARK_USECOLS)
+CARPARK_COORDS, CARPARK_TREE = build_location_tree(CARPARK_RECORDS)
+
+
+def _build_location_records(
+    location_records: List[Dict],
+    coords: np.ndarray,
+    idx_array: np.ndarray,
+    point_of_interest: Tuple[float, float],
+    radius_in_km: Optional[float] = None
+) -> List[Dict]:
+    """Function which builds location records sorted by distance from point of interest for selected static locations.
+
+    Args:
+        location_records (List[Dict]): List of static location records.
+        coords (np.ndarray): Array of (lat, lon) coordinates of location_records.
+        idx_array (np.ndarray): Positions of location_records to be included.
+        point_of_interest (Tuple[float, float]): WGS84 Lat,Lon coordinates.
+        radius_in_km (Optional[float], optional): Locations further than this distance in KM are dropped. Defaults to None, which keeps all locations.
+
+    Returns:
+        List[Dict]: List of location records with additional distance_km key, sorted by distance.
+    """
+    distance_array = haversine_distance_km(point_of_interest[0],
+                                           point_of_interest[1],
+                                           coords[idx_array, 0],
+                                           coords[idx_array, 1])
+    # Drop locations outside radius before any record is built or sorted
+    if radius_in_km is not None:
+        within_radius_mask = distance_array <= radius_in_km
+        idx_array, distance_array = idx_array[within_radius_mask], distance_array[within_radius_mask]
+    order = np.argsort(distance_array)
+    return [
+        {**location_records[idx], "distance_km": float(distance_km)}
+        for idx, distance_km in zip(idx_array[order].tolist(), distance_array[order].tolist())
+    ]
+
+
+def query_locations_within_radius(
+    location_records: List[Dict],
+    coords: np.ndarray,
+    location_tree: cKDTree,
+    point_of_interest: Tuple[float, float],
+    radius_in_km: float
+) -> List[Dict]:
+    """Function which queries static locations within a radius of a point of interest.
+
+    Args:
+        location_records (List[Dict]): List of static location records.
+        coords (np.ndarray): Array of (lat, lon) coordinates of location_records used to build location_tree.
+        location_tree (cKDTree): KD-tree built over coords.
+        point_of_interest (Tuple[float, float]): WGS84 Lat,Lon coordinates.
+        radius_in_km (float): Size of radius surrounding the point of interest in KM.
+
+    Returns:
+        List[Dict]: List of location records within radius with additional distance_km key, sorted by distance.
+    """
+    # Slightly widen search radius in degrees, exact distances are checked after
+    candidate_idx = location_tree.query_ball_point(point_of_interest, r=radius_in_km / KM_PER_DEGREE * 1.01)
+    return _build_location_records(location_records, coords, np.asarray(candidate_idx, dtype=np.intp), point_of_interest, radius_in_km)
@@ -1,15 +1,60 @@
+import logging
+import threading
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
+import flask
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 import numpy as np
-from dash import Dash, dcc, html, Input, Output, callback
 from conf.api_key import LTA_API_KEY
-from geopy.distance import geodesic
-from typing import Union, Dict, Tuple, List
+from conf.cache_config import cache
+from helpers.geo_utils import haversine_distance_km, bounding_box_mask
+from typing import Callable, Union, Dict, Tuple, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # Load API URL configuration
-with open("api_url_config.yml", "r") as f:
+with open("conf/api_url_config.yml", "r") as f:
     api_url_dict = yaml.safe_load(f.read())
 
+# Cache timeout (in seconds) of each API based on how often its upstream data changes
+DEFAULT_API_CACHE_TIMEOUT = 300
+API_CACHE_TIMEOUT_DICT = {
+    api_url_dict["BUS_STOPS_API"]: 86400,
+    api_url_dict["TAXI_STANDS_API"]: 86400,
+    api_url_dict["BICYCLE_PARKING_API"]: 86400,
+    api_url_dict["TRAFFIC_IMAGES_API"]: 60,
+    api_url_dict["CARPARK_AVAILABILITY_API"]: 60,
+}
+
+# Shared session which keeps connections to API hosts alive across queries. Transient gateway errors are retried.
+SESSION = requests.Session()
+for prefix in ("http://", "https://"):
+    SESSION.mount(prefix, HTTPAdapter(pool_connections=10,
+                                      pool_maxsize=16,
+                                      max_retries=Retry(total=2,
+                                                        backoff_factor=0.2,
+                                                        status_forcelist=(502, 503, 504))))
+
+# Connect and read timeout (in seconds) so that a stalled API cannot hang a callback
+REQUEST_TIMEOUT = (1.5, 5)
+
+# Maximum number of records returned by a single DataMall request, further records are requested with $skip
+DATAMALL_PAGE_SIZE = 500
+
+# Nearby transport artefacts which are queried together for a selected point
+NEARBY_TRANSPORT_API_NAME_LIST = ["BUS_STOPS_API", "TAXI_STANDS_API", "BICYCLE_PARKING_API"]
+
+# Worker threads for issuing independent API queries concurrently
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# In-flight upstream queries keyed by cache key, so that concurrent cache misses share a single request
+_inflight_lock = threading.Lock()
+_inflight_query_dict: Dict[str, Future] = {}
+
 def api_query(
     api_link: str,
     agent_id: str,
@@ -29,36 +74,136 @@ def api_query(
     """
     req_headers = {"User-agent": agent_id, "AccountKey": api_key, "Content-Type": "application/json"}
     try:
-        res = requests.get(url=api_link,
-                           params=params_dict,
-                           headers=req_headers,
-                           timeout=5)
+        res = SESSION.get(url=api_link,
+                          params=params_dict,
+                          headers=req_headers,
+                          timeout=REQUEST_TIMEOUT)
         # Raise if HTTPError occured
         res.raise_for_status()
 
         # Check the status code before extending the number of posts
-        print(f"Request successful with status code {res.status_code}")
-        the_json = res.json()
+        logger.debug("Request to %s successful with status code %s", api_link, res.status_code)
+        the_json = orjson.loads(res.content)
         return the_json
     except requests.exceptions.HTTPError as errh:
-        print(errh)
+        logger.warning(errh)
     except requests.exceptions.ConnectionError as errc:
-        print(errc)
+        logger.warning(errc)
     except requests.exceptions.Timeout as errt:
-        print(errt)
+        logger.warning(errt)
     except requests.exceptions.RequestException as err:
-        print(err)
+        logger.warning(err)
+    except orjson.JSONDecodeError as errj:
+        logger.warning(errj)
     return {}
 
+def cached_api_query(
+    api_link: str,
+    agent_id: str,
+    api_key: str,
+    params_dict: Dict = None
+) -> Dict:
+    """Function which wraps api_query with a shared cache, so that one upstream response is reused by all callbacks until the timeout configured for api_link expires.
+
+    Args:
+        api_link (str): API Link which requests is to be made
+        agent_id (str): Id used for request header
+        api_key (str): API Key provided
+        params_dict (Dict): Dictionary containing parameters to be passed in requests' get method. Defaults to None.
+
+    Returns:
+        Dictionary containing request content. Empty dictionary when exception are encountered.
+    """
+    cache_key = f"api_query::{api_link}::{sorted((params_dict or {}).items())}"
+    api_response = cache.get(cache_key)
+    if api_response is not None:
+        return api_response
+
+    def _query() -> Dict:
+        api_response = api_query(api_link=api_link,
+                                 agent_id=agent_id,
+                                 api_key=api_key,
+                                 params_dict=params_dict)
+        # Failed queries are not cached so that they are retried on next call
+        if api_response:
+            cache.set(cache_key,
+                      api_response,
+                      timeout=API_CACHE_TIMEOUT_DICT.get(api_link, DEFAULT_API_CACHE_TIMEOUT))
+        return api_response
+
+    return _coalesced_query(cache_key, _query)
+
+def _coalesced_query(cache_key: str, query_func: Callable[[], Dict]) -> Dict:
+    """Function which runs query_func for a cache miss on cache_key, so that concurrent callers missing the same cache key share a single upstream query.
+
+    Args:
+        cache_key (str): Cache key which query_func fills.
+        query_func (Callable[[], Dict]): Function which performs the query and caches its result.
+
+    Returns:
+        Dict: Result of query_func, either from this caller or from the caller already running it.
+    """
+    # First caller on a miss performs the query, others wait on its result
+    with _inflight_lock:
+        inflight_query = _inflight_query_dict.get(cache_key)
+        is_query_owner = inflight_query is None
+        if is_query_owner:
+            inflight_query = Future()
+            _inflight_query_dict[cache_key] = inflight_query
+
+    if not is_query_owner:
+        return inflight_query.result()
+
+    try:
+        query_result = query_func()
+        inflight_query.set_result(query_result)
+    except Exception as err:
+        inflight_query.set_exception(err)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_query_dict.pop(cache_key, None)
+    return query_result
+
+def query_all_datamall_records(
+    api_link: str,
+    params_dict: Dict = None
+) -> Optional[List[Dict]]:
+    """Function which queries all records of a DataMall API by requesting successive pages with $skip until a page shorter than DATAMALL_PAGE_SIZE is returned. Each page is cached by cached_api_query.
+
+    Args:
+        api_link (str): DataMall API link which requests is to be made
+        params_dict (Dict): Dictionary containing parameters to be passed in requests' get method besides $skip. Defaults to None.
+
+    Returns:
+        Optional[List[Dict]]: List of records of all pages. None when any page fails, so that partial data is not mistaken for complete data.
+    """
+    record_list = []
+    skip = 0
+    while True:
+        api_response = cached_api_query(api_link=api_link,
+                                        agent_id="test",
+                                        api_key=LTA_API_KEY,
+                                        params_dict={**(params_dict or {}), "$skip": skip})
+        page_record_list = api_response.get("value")
+        if page_record_list is None:
+            return None
+        record_list.extend(page_record_list)
+        if len(page_record_list) < DATAMALL_PAGE_SIZE:
+            return record_list
+        skip += DATAMALL_PAGE_SIZE
+
 def geodesic_distance_filter(
         centre_point: Tuple[float,float],
         radius_in_km: float,
         data_list: List[Dict],
         latitude_key_name: str,
         longitude_key_name: str
-) -> Tuple(List[Dict], Dict):
+) -> Tuple[List[Dict], Dict]:
     """Function which filters out locations from a provided list of locations(data_list) of a particular transport related artifact of interest(e.g bus stops, taxi stands) that is located within a specified radius(radius_in_km) of a point of interest(centre_point).
 
+    Distances are spherical haversine distances, not WGS84 ellipsoidal geodesic distances as computed by geopy. Near Singapore they are up to about 0.6% (about 5.6m per km) longer north-south and about 0.1% shorter east-west, so artefacts within a few metres of the radius boundary may be included or excluded differently.
+
     Args:
         centre_point (Tuple[float,float]): WGS84 Lat,Lon coordinates
         radius_in_km (float): Radius of centre_point considered
@@ -68,28 +213,36 @@ def geodesic_distance_filter(
 
     Returns:
         Tuple(List[Dict], Dict) containing:
-            - List of dictionary containing geographic related artefacts that is within a radius of specified point of interest.
+            - List of dictionary containing geographic related artefacts that is within a radius of specified point of interest, sorted by distance.
             - Dict containing nearest geographic point artefacts.
     """
+    # Extract both coordinates of every artefact in a single pass
+    coord_array = np.array(list(map(itemgetter(latitude_key_name, longitude_key_name), data_list)), dtype=np.float64).reshape(-1, 2)
+    lat_array, lon_array = coord_array[:, 0], coord_array[:, 1]
 
-    distance_list = np.array([geodesic(centre_point, tuple([data[latitude_key_name], data[longitude_key_name]])).kilometers for data in data_list])
-
-    # Get nearest point
-    idx_min_distance_list = np.argmin(distance_list)
+    # Cheap bounding box prefilter, so that exact distances are only computed for artefacts near centre point
+    candidate_idx = np.flatnonzero(bounding_box_mask(centre_point[0], centre_point[1], lat_array, lon_array, radius_in_km))
+    distance_array = haversine_distance_km(centre_point[0], centre_point[1], lat_array[candidate_idx], lon_array[candidate_idx])
 
-    nearest_data_point = data_list[idx_min_distance_list]
+    # Get nearby points sorted by distance
+    within_radius_pos = np.flatnonzero(distance_array < radius_in_km)
+    within_radius_pos = within_radius_pos[np.argsort(distance_array[within_radius_pos])]
+    nearby_points = [data_list[idx] for idx in candidate_idx[within_radius_pos]]
 
-    # Get nearby points
-    within_radius_idx = np.argwhere(distance_list < radius_in_km)[0]
-    nearby_points = [data_list[idx] for idx in within_radius_idx]
+    # Get nearest point, which is the first nearby point if there is any. Otherwise all artefacts have to be checked.
+    if nearby_points:
+        nearest_data_point = nearby_points[0]
+    else:
+        distance_array = haversine_distance_km(centre_point[0], centre_point[1], lat_array, lon_array)
+        nearest_data_point = data_list[int(np.argmin(distance_array))]
 
     return nearby_points, nearest_data_point
 
 def query_filter_surrounding_transport_artefacts(
         api_link: str,
-        point_of_interest: Tuple(float,float),
+        point_of_interest: Tuple[float,float],
         radius_in_km:float,
-    ) -> Tuple(List[Dict], Dict):
+    ) -> Optional[Tuple[List[Dict], Dict]]:
     """Function which queries various transport related artefacts using a provided api_link .
 
     Args:
@@ -98,20 +251,67 @@ def query_filter_surrounding_transport_artefacts(
         radius_in_km (float): Size of radius surrounding the point of interest in KM.
 
     Returns:
-        Tuple(List[Dict], Dict): A Tuple containing a List of dict and Dict representing nearby data points and nearest point data artefacts respectively.
+        Optional[Tuple(List[Dict], Dict)]: A Tuple containing a List of dict and Dict representing nearby data points and nearest point data artefacts respectively. None when API query fails.
     """
-    api_response = api_query(api_link=api_link,
-                             agent_id="test",
-                             api_key=LTA_API_KEY)
-    api_response_data_list = api_response.get("value")
-
-    # Get nearby data
-    surrounding_data_list, nearest_data_list = geodesic_distance_filter(
-        centre_point=point_of_interest,
-        radius_in_km=radius_in_km,
-        data_list=api_response_data_list,
-        latitude_key_name="Latitude",
-        longitude_key_name="Longitude"
-    )
-
-    return surrounding_data_list, nearest_data_list
\ No newline at end of file
+    # Round to 4 decimal places (~11m) so that repeated selections of about the same point share a cache entry
+    quantized_point = (round(point_of_interest[0], 4), round(point_of_interest[1], 4))
+    cache_key = f"surrounding_artefacts::{api_link}::{quantized_point}::{radius_in_km}"
+    cached_result = cache.get(cache_key)
+    if cached_result is not None:
+        return cached_result
+
+    # Bicycle parking API only returns points within Dist (in KM) of Lat/Long, instead of all points
+    params_dict = None
+    if api_link == api_url_dict["BICYCLE_PARKING_API"]:
+        params_dict = {"Lat": quantized_point[0], "Long": quantized_point[1], "Dist": radius_in_km}
+
+    api_response_data_list = query_all_datamall_records(api_link=api_link, params_dict=params_dict)
+    # Failed queries are not cached so that they are retried on next call
+    if api_response_data_list is None:
+        return None
+
+    # Get nearby data. Bicycle parking API returns no record when there is no point within Dist.
+    if api_response_data_list:
+        surrounding_data_list, nearest_data_list = geodesic_distance_filter(
+            centre_point=quantized_point,
+            radius_in_km=radius_in_km,
+            data_list=api_response_data_list,
+            latitude_key_name="Latitude",
+            longitude_key_name="Longitude"
+        )
+    else:
+        surrounding_data_list, nearest_data_list = [], {}
+
+    # Filtered result is kept no longer than the API response it is derived from
+    cache.set(cache_key,
+              (surrounding_data_list, nearest_data_list),
+              timeout=API_CACHE_TIMEOUT_DICT.get(api_link, DEFAULT_API_CACHE_TIMEOUT))
+    return surrounding_data_list, nearest_data_list
+
+def query_all_surrounding_transport_artefacts(
+        point_of_interest: Tuple[float,float],
+        radius_in_km: float,
+    ) -> Dict[str, Optional[Tuple[List[Dict], Dict]]]:
+    """Function which queries all nearby transport related artefacts of a point of interest concurrently, so that total waiting time is bounded by the slowest API instead of the sum of all APIs. Must be called within a Flask app context, e.g. from a callback.
+
+    Args:
+        point_of_interest (Tuple[float,float]): Tuple representing lat/lon coordinates of a point of interest
+        radius_in_km (float): Size of radius surrounding the point of interest in KM.
+
+    Returns:
+        Dict[str, Optional[Tuple[List[Dict], Dict]]]: Dictionary with API name in NEARBY_TRANSPORT_API_NAME_LIST as key and its nearby data points and nearest point data artefacts as value. Value is None when query of that API fails.
+    """
+    # Worker threads need the app context of the caller to reach the shared cache
+    app = flask.current_app._get_current_object()
+
+    def _query(api_link: str) -> Optional[Tuple[List[Dict], Dict]]:
+        with app.app_context():
+            return query_filter_surrounding_transport_artefacts(api_link=api_link,
+                                                                point_of_interest=point_of_interest,
+                                                                radius_in_km=radius_in_km)
+
+    future_dict = {
+        api_name: _executor.submit(_query, api_url_dict[api_name])
+        for api_name in NEARBY_TRANSPORT_API_NAME_LIST
+    }
+    return {api_name: future.result() for api_name, future in future_dict.items()}
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Build step which pre-bakes static map data into JSON files served from the
+assets folder, so that the dashboard does not parse CSV files on startup.
+
+Run from the project root whenever files in data/ are updated:
+
+    python scripts/bake_static.py
+"""
+import csv
+import os
+
+import orjson
+
+TRAFFIC_CAM_LOCATIONS_CSV = os.path.join("data", "traffic_cams_location.csv")
+TRAFFIC_CAM_LOCATIONS_JSON = os.path.join("assets", "traffic_cam_locations.json")
+
+
+def bake_traffic_cam_locations(csv_path: str, json_path: str) -> int:
+    """Function which converts traffic camera location csv into a column oriented JSON file which can be consumed directly by plotly express.
+
+    Args:
+        csv_path (str): Filepath of traffic camera location csv.
+        json_path (str): Filepath of JSON file to be written.
+
+    Returns:
+        int: Number of traffic camera locations written.
+    """
+    traffic_cam_locations = {"ID": [], "Lat": [], "Lon": [], "Description of Location": []}
+    # Csv file is saved with BOM
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            traffic_cam_locations["ID"].append(int(row["ID"]))
+            traffic_cam_locations["Lat"].append(float(row["Lat"]))
+            traffic_cam_locations["Lon"].append(float(row["Lon"]))
+            traffic_cam_locations["Description of Location"].append(row["Description of Location"])
+
+    with open(json_path, "wb") as f:
+        f.write(orjson.dumps(traffic_cam_locations))
+
+    return len(traffic_cam_locations["ID"])
+
+
+if __name__ == "__main__":
+    num_locations = bake_traffic_cam_locations(TRAFFIC_CAM_LOCATIONS_CSV, TRAFFIC_CAM_LOCATIONS_JSON)
+    print(f"Written {num_locations} traffic camera locations to {TRAFFIC_CAM_LOCATIONS_JSON}")